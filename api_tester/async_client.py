@@ -0,0 +1,329 @@
+"""
+Asynchronous HTTP client for concurrent benchmarking.
+
+Requests are dispatched as asyncio tasks over a shared keep-alive connection
+pool by ``concurrency`` worker tasks, so at most that many requests are in
+flight at once. Two backends are available:
+
+- ``aiohttp`` (``pip install api_tester[async]``): HTTP/1.1 keep-alive
+- ``httpx`` (``pip install api_tester[http2]``): HTTP/2, multiplexing all
+  requests to a host as streams over one connection
+"""
+
+import asyncio
+import ssl
+import time
+import warnings
+from contextlib import nullcontext
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - depends on environment
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on environment
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (required by httpx for HTTP/2)
+except ImportError:  # pragma: no cover - depends on environment
+    h2 = None
+
+from .client import READ_CHUNK_SIZE
+from .models import (
+    APIRequest,
+    APIResponse,
+    BenchmarkResult,
+    TestConfig,
+    benchmark_collector,
+)
+from .ratelimit import TokenBucket
+
+BACKENDS = ("aiohttp", "httpx")
+
+
+class AsyncAPIClient:
+    """Async HTTP client that runs benchmark requests concurrently."""
+
+    def __init__(
+        self,
+        config: Optional[TestConfig] = None,
+        concurrency: int = 64,
+        limit_per_host: int = 64,
+        keepalive_timeout: float = 30.0,
+        backend: str = "aiohttp",
+        http2: bool = True,
+    ):
+        """
+        Initialize async API client.
+
+        Args:
+            config: Test configuration (uses defaults if not provided)
+            concurrency: Default maximum number of in-flight requests
+            limit_per_host: Maximum open connections per host
+            keepalive_timeout: Seconds an idle connection is kept open
+            backend: "aiohttp" or "httpx"; httpx falls back to aiohttp
+                (HTTP/1.1) when httpx or its HTTP/2 support is not installed
+            http2: Negotiate HTTP/2; only applies to the httpx backend, as
+                aiohttp always speaks HTTP/1.1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}")
+        if backend == "httpx" and (httpx is None or (http2 and h2 is None)):
+            if aiohttp is None:
+                raise ImportError(
+                    "httpx backend requires httpx[http2] (pip install api_tester[http2])"
+                )
+            warnings.warn(
+                "httpx[http2] is not installed; falling back to aiohttp (HTTP/1.1)",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            backend = "aiohttp"
+        if backend == "aiohttp" and aiohttp is None:
+            raise ImportError(
+                "aiohttp backend requires aiohttp (pip install api_tester[async])"
+            )
+        self.backend = backend
+        self.http2 = http2
+        self.config = config or TestConfig()
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._rate_limiter = (
+            TokenBucket(self.config.rate_limit, self.config.rate_limit_burst)
+            if self.config.rate_limit
+            else nullcontext()
+        )
+        # aiohttp.ClientSession or httpx.AsyncClient, created on __aenter__
+        self._session = None
+
+    async def __aenter__(self):
+        ssl_ctx = ssl.create_default_context() if self.config.verify_ssl else False
+        if self.backend == "httpx":
+            self._session = httpx.AsyncClient(
+                http2=self.http2,
+                verify=ssl_ctx,
+                follow_redirects=self.config.follow_redirects,
+                limits=httpx.Limits(
+                    max_connections=self.limit_per_host,
+                    max_keepalive_connections=self.limit_per_host,
+                    keepalive_expiry=self.keepalive_timeout,
+                ),
+            )
+            self._send = self._send_httpx
+            self._connection_errors = (httpx.TransportError,)
+        else:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=ssl_ctx,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._send = self._send_aiohttp
+            self._connection_errors = (aiohttp.ClientConnectionError,)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying session and its pooled connections."""
+        if self._session is None:
+            return
+        if self.backend == "httpx":
+            await self._session.aclose()
+        else:
+            await self._session.close()
+        self._session = None
+
+    async def make_request(
+        self, request: APIRequest, discard_body: bool = False
+    ) -> APIResponse:
+        """
+        Make a single API request, waiting for the rate limiter if configured.
+
+        Args:
+            request: API request configuration
+            discard_body: Read the response body without decoding or storing it
+
+        Returns:
+            APIResponse with results
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncAPIClient must be used as 'async with' context")
+
+        async with self._rate_limiter:
+            return await self._make_request_internal(request, discard_body)
+
+    async def _send_aiohttp(
+        self, request: APIRequest, discard_body: bool
+    ) -> Tuple[int, str, Dict[str, str], str, int]:
+        """
+        Send a request with aiohttp.
+
+        Returns:
+            Tuple of (status_code, reason, headers, body, content_length)
+        """
+        async with self._session.request(
+            request.method,
+            request._full_url,
+            data=request._encoded_body,
+            headers=request._final_headers,
+            timeout=aiohttp.ClientTimeout(total=request.timeout),
+            allow_redirects=self.config.follow_redirects,
+        ) as response:
+            if discard_body:
+                body = ""
+                content_length = 0
+                async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                    content_length += len(chunk)
+            else:
+                raw_body = await response.read()
+                body = raw_body.decode("utf-8")
+                content_length = len(raw_body)
+            return (
+                response.status,
+                response.reason or "",
+                dict(response.headers),
+                body,
+                content_length,
+            )
+
+    async def _send_httpx(
+        self, request: APIRequest, discard_body: bool
+    ) -> Tuple[int, str, Dict[str, str], str, int]:
+        """
+        Send a request with httpx (HTTP/2 when negotiated).
+
+        Returns:
+            Tuple of (status_code, reason, headers, body, content_length)
+        """
+        async with self._session.stream(
+            request.method,
+            request._full_url,
+            content=request._encoded_body,
+            headers=request._final_headers,
+            timeout=request.timeout,
+        ) as response:
+            if discard_body:
+                body = ""
+                content_length = 0
+                async for chunk in response.aiter_bytes(READ_CHUNK_SIZE):
+                    content_length += len(chunk)
+            else:
+                raw_body = await response.aread()
+                body = raw_body.decode("utf-8")
+                content_length = len(raw_body)
+            # HTTP/2 has no reason phrase, so fall back to the standard one
+            reason = response.reason_phrase
+            if not reason:
+                try:
+                    reason = HTTPStatus(response.status_code).phrase
+                except ValueError:
+                    reason = ""
+            return (
+                response.status_code,
+                reason,
+                dict(response.headers),
+                body,
+                content_length,
+            )
+
+    async def _make_request_internal(
+        self, request: APIRequest, discard_body: bool = False
+    ) -> APIResponse:
+        """
+        Internal method to make HTTP request.
+
+        Args:
+            request: API request configuration
+            discard_body: Read the response body without decoding or storing it
+
+        Returns:
+            APIResponse with results
+        """
+        start_time = time.perf_counter()
+        error_msg = None
+
+        try:
+            status_code, reason, headers, body, content_length = await self._send(
+                request, discard_body
+            )
+            if status_code >= 300:
+                error_msg = f"HTTP {status_code}: {reason}"
+
+        except self._connection_errors as e:
+            body = ""
+            content_length = 0
+            status_code = 0
+            headers = {}
+            error_msg = f"URL Error: {e}"
+
+        except Exception as e:
+            body = ""
+            content_length = 0
+            status_code = 0
+            headers = {}
+            error_msg = f"{type(e).__name__}: {str(e)}"
+
+        elapsed_time = time.perf_counter() - start_time
+
+        return APIResponse(
+            status_code=status_code,
+            headers=headers,
+            body=body,
+            elapsed_time=elapsed_time,
+            error=error_msg,
+            content_length=content_length,
+        )
+
+    async def benchmark(
+        self,
+        request: APIRequest,
+        num_requests: int = 10,
+        concurrency: Optional[int] = None,
+    ) -> BenchmarkResult:
+        """
+        Benchmark an endpoint with concurrent requests.
+
+        Only timings, status codes and errors are kept unless
+        config.store_responses is set; bodies are drained and dropped unless
+        config.store_bodies is set as well. With config.streaming_stats only
+        running aggregates are kept, so memory stays constant in N.
+
+        Args:
+            request: API request configuration
+            num_requests: Number of requests to make
+            concurrency: Maximum in-flight requests (defaults to client setting)
+
+        Returns:
+            BenchmarkResult with aggregated statistics
+        """
+        if num_requests < 0:
+            raise ValueError("num_requests must be non-negative")
+        concurrency = self.concurrency if concurrency is None else concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        samples = benchmark_collector(num_requests, self.config)
+        discard_body = not (self.config.store_responses and self.config.store_bodies)
+        # A fixed set of worker tasks pulls indices from one shared iterator,
+        # bounding in-flight requests without creating a task per request
+        indices = iter(range(num_requests))
+        workers = min(concurrency, num_requests)
+
+        async def worker():
+            for index in indices:
+                samples.record(index, await self.make_request(request, discard_body))
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        total_duration = time.perf_counter() - start_time
+
+        return samples.to_result(request.url, total_duration)
@@ -3,12 +3,13 @@ Command-line interface for API Client Tester.
 """
 
 import argparse
-import json
+import asyncio
 import sys
 from typing import Optional
 
 from .client import APIClient
 from .models import APIRequest, TestConfig
+from .serialization import JSONDecodeError, dumps_pretty, loads
 
 
 def format_response(response, verbose: bool = False):
@@ -30,9 +31,9 @@ def format_response(response, verbose: bool = False):
 
         print("\n📄 Body:")
         try:
-            parsed = json.loads(response.body)
-            print(json.dumps(parsed, indent=2))
-        except json.JSONDecodeError:
+            parsed = loads(response.body)
+            print(dumps_pretty(parsed))
+        except JSONDecodeError:
             print(response.body[:500])
             if len(response.body) > 500:
                 print(f"... ({len(response.body) - 500} more characters)")
@@ -48,9 +49,14 @@ def format_benchmark(result):
         f"Successful:         {result.successful_requests} ({result.success_rate:.1f}%)"
     )
     print(f"Failed:             {result.failed_requests}")
+    classes = ", ".join(f"{k}: {v}" for k, v in result.status_class_counts.items())
+    print(f"Status Classes:     {classes or '-'}")
     print("\n⏱  TIMING STATISTICS")
     print(f"Average:            {result.avg_time*1000:.2f}ms")
     print(f"Median:             {result.median_time*1000:.2f}ms")
+    print(f"P95:                {result.p95_time*1000:.2f}ms")
+    print(f"P99:                {result.p99_time*1000:.2f}ms")
+    print(f"Std Dev:            {result.std_time*1000:.2f}ms")
     print(f"Min:                {result.min_time*1000:.2f}ms")
     print(f"Max:                {result.max_time*1000:.2f}ms")
     print("\n🚀 THROUGHPUT")
@@ -70,6 +76,22 @@ def parse_headers(header_strings: Optional[list]) -> dict:
     return headers
 
 
+async def run_async_benchmark(
+    config: TestConfig,
+    request: APIRequest,
+    num_requests: int,
+    concurrency: int,
+    backend: str = "aiohttp",
+):
+    """Run a benchmark through the async client."""
+    from .async_client import AsyncAPIClient
+
+    async with AsyncAPIClient(
+        config, concurrency=concurrency, backend=backend
+    ) as client:
+        return await client.benchmark(request, num_requests)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -82,6 +104,8 @@ Examples:
   api-test https://api.example.com --benchmark 100
   api-test https://httpbin.org/post -X POST -d '{"key":"value"}'
   api-test https://api.example.com --retry 5 --rate-limit 10
+  api-test https://api.example.com --benchmark 1000 --async --concurrency 64
+  api-test https://api.example.com --benchmark 1000 --http2
         """,
     )
 
@@ -117,10 +141,59 @@ Examples:
     parser.add_argument(
         "--rate-limit", type=float, help="Rate limit in requests per second"
     )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=1,
+        help="Requests allowed in a burst under --rate-limit (default: 1)",
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache GET/HEAD/OPTIONS responses (sync client only)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=60.0,
+        help="Seconds a cached response stays valid (default: 60)",
+    )
 
     parser.add_argument(
         "--benchmark", type=int, metavar="N", help="Run benchmark with N requests"
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        metavar="K",
+        help="Worker threads for a sync --benchmark (default: 1, max: 32)",
+    )
+    parser.add_argument(
+        "--stream-stats",
+        action="store_true",
+        help="Aggregate --benchmark statistics on the fly in constant memory "
+        "(percentiles from a 10,000-request sample)",
+    )
+    parser.add_argument(
+        "--async",
+        action="store_true",
+        dest="use_async",
+        help="Run benchmark requests concurrently with asyncio (requires aiohttp)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=64,
+        metavar="K",
+        help="Maximum concurrent requests with --async (default: 64)",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use HTTP/2 via httpx for the benchmark (implies --async)",
+    )
     parser.add_argument(
         "--no-verify-ssl",
         action="store_true",
@@ -135,7 +208,7 @@ Examples:
     try:
         # Build request
         headers = parse_headers(args.headers)
-        body = json.loads(args.data) if args.data else None
+        body = loads(args.data) if args.data else None
 
         request = APIRequest(
             url=args.url,
@@ -150,6 +223,10 @@ Examples:
             retry_attempts=args.retry,
             retry_delay=args.retry_delay,
             rate_limit=args.rate_limit,
+            rate_limit_burst=args.burst,
+            cache_responses=args.cache,
+            cache_ttl=args.cache_ttl,
+            streaming_stats=args.stream_stats,
             verify_ssl=not args.no_verify_ssl,
         )
 
@@ -159,7 +236,18 @@ Examples:
         # Execute request(s)
         if args.benchmark:
             print(f"🚀 Benchmarking {args.url} with {args.benchmark} requests...")
-            result = client.benchmark(request, args.benchmark)
+            if args.use_async or args.http2:
+                result = asyncio.run(
+                    run_async_benchmark(
+                        config,
+                        request,
+                        args.benchmark,
+                        args.concurrency,
+                        backend="httpx" if args.http2 else "aiohttp",
+                    )
+                )
+            else:
+                result = client.benchmark(request, args.benchmark, args.threads)
 
             if args.json:
                 output = {
@@ -168,14 +256,18 @@ Examples:
                     "successful_requests": result.successful_requests,
                     "failed_requests": result.failed_requests,
                     "success_rate": result.success_rate,
+                    "status_classes": result.status_class_counts,
                     "avg_time_ms": result.avg_time * 1000,
                     "median_time_ms": result.median_time * 1000,
+                    "p95_time_ms": result.p95_time * 1000,
+                    "p99_time_ms": result.p99_time * 1000,
+                    "std_time_ms": result.std_time * 1000,
                     "min_time_ms": result.min_time * 1000,
                     "max_time_ms": result.max_time * 1000,
                     "total_duration_s": result.total_duration,
                     "requests_per_second": result.requests_per_second,
                 }
-                print(json.dumps(output, indent=2))
+                print(dumps_pretty(output))
             else:
                 format_benchmark(result)
         else:
@@ -188,11 +280,12 @@ Examples:
                     "status_code": response.status_code,
                     "success": response.success,
                     "elapsed_ms": response.elapsed_ms,
+                    "timestamp": response.timestamp.isoformat(),
                     "headers": response.headers,
                     "body": response.body,
                     "error": response.error,
                 }
-                print(json.dumps(output, indent=2))
+                print(dumps_pretty(output))
             else:
                 format_response(response, args.verbose)
 
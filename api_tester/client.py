@@ -4,17 +4,67 @@ HTTP client for API testing with decorator support.
 Combines decorators and dataclasses for a practical API testing tool.
 """
 
-import json
-import statistics
+import http.client
+import ssl
+import threading
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
-from datetime import datetime
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .decorators import CallCounter, cache_response, retry
+from .models import (
+    DEFAULT_USER_AGENT,
+    APIRequest,
+    APIResponse,
+    BenchmarkResult,
+    Origin,
+    TestConfig,
+    benchmark_collector,
+    split_url,
+)
+from .ratelimit import TokenBucket
+
+MAX_REDIRECTS = 10
+MAX_BENCHMARK_THREADS = 32
+# Below this many requests a thread pool costs more than it saves
+MIN_THREADED_REQUESTS = 4
+READ_CHUNK_SIZE = 65536
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Errors raised when a kept-alive connection was closed by the server
+STALE_CONNECTION_ERRORS = (
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _ResumableHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that offers a previous TLS session for resumption."""
+
+    def __init__(self, *args, session: Optional[ssl.SSLSession] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tls_session = session
 
-from .decorators import CallCounter, rate_limit, retry
-from .models import APIRequest, APIResponse, BenchmarkResult, TestConfig
+    @property
+    def tls_session(self) -> Optional[ssl.SSLSession]:
+        """Session of the live socket, or of the last one after close()."""
+        if isinstance(self.sock, ssl.SSLSocket):
+            return self.sock.session
+        return self._tls_session
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=self.host, session=self._tls_session
+        )
+
+    def close(self):
+        # sock is still the plain TCP socket if the TLS handshake failed
+        if isinstance(self.sock, ssl.SSLSocket) and self.sock.session is not None:
+            self._tls_session = self.sock.session
+        super().close()
 
 
 class APIClient:
@@ -24,18 +74,176 @@ class APIClient:
         """
         Initialize API client with test configuration.
 
+        The retry, rate-limit and cache wrappers are built here once, so
+        changes to the config after construction are not picked up; create a
+        new client instead.
+
         Args:
             config: Test configuration (uses defaults if not provided)
         """
         self.config = config or TestConfig()
         self._call_counter = CallCounter(self._make_request_internal)
 
-    def _make_request_internal(self, request: APIRequest) -> APIResponse:
+        # Build decorated function based on config
+        fn = self._call_counter
+
+        # Apply retry decorator if configured
+        if self.config.retry_attempts > 1:
+            fn = retry(
+                attempts=self.config.retry_attempts, delay=self.config.retry_delay
+            )(fn)
+
+        # Apply rate limiting if configured
+        if self.config.rate_limit:
+            fn = TokenBucket(self.config.rate_limit, self.config.rate_limit_burst)(fn)
+
+        # Serve repeated idempotent requests from cache (no rate-limit token used)
+        if self.config.cache_responses:
+            fn = cache_response(
+                maxsize=self.config.cache_maxsize, ttl=self.config.cache_ttl
+            )(fn)
+
+        self._dispatch = fn
+        self._pools: Dict[Origin, List[http.client.HTTPConnection]] = {}
+        self._tls_sessions: Dict[Origin, ssl.SSLSession] = {}
+        self._pool_lock = threading.Lock()
+        # One context for every connection, so TLS sessions can be resumed
+        self._ssl_ctx = (
+            ssl.create_default_context()
+            if self.config.verify_ssl
+            else ssl._create_unverified_context()
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_connection(
+        self, key: Origin, timeout: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take an idle connection from the pool or open a new one.
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for pooled
+            connections that may have been closed by the server meanwhile.
+        """
+        with self._pool_lock:
+            idle = self._pools.get(key)
+            conn = idle.pop() if idle else None
+
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        scheme, host, port = key
+        if scheme == "https":
+            conn = _ResumableHTTPSConnection(
+                host,
+                port,
+                timeout=timeout,
+                context=self._ssl_ctx,
+                session=self._tls_sessions.get(key),
+            )
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def _release_connection(self, key: Origin, conn: http.client.HTTPConnection):
+        """Return a connection to the pool so the next request can reuse it."""
+        with self._pool_lock:
+            self._pools.setdefault(key, []).append(conn)
+
+    def _remember_tls_session(self, key: Origin, conn: http.client.HTTPConnection):
+        """
+        Keep the connection's TLS session so new connections can resume it.
+
+        Called once a response has been read, by which point TLS 1.3 servers
+        have sent their session ticket.
+        """
+        session = getattr(conn, "tls_session", None)
+        if session is not None:
+            with self._pool_lock:
+                self._tls_sessions[key] = session
+
+    def _send(
+        self,
+        method: str,
+        key: Origin,
+        path: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        discard_body: bool = False,
+        simple_get: bool = False,
+    ) -> Tuple[int, str, http.client.HTTPMessage, bytes, int]:
+        """
+        Send a single HTTP request over a pooled keep-alive connection.
+
+        A reused connection that turns out to be stale is discarded and the
+        request is retried once on a fresh connection. A simple GET (no body,
+        only the default User-Agent) writes its request line and header
+        directly instead of going through HTTPConnection.request.
+
+        Returns:
+            Tuple of (status_code, reason, headers, body, content_length);
+            body is empty when discard_body is set
+        """
+        while True:
+            conn, reused = self._get_connection(key, timeout)
+            try:
+                if simple_get:
+                    conn.putrequest("GET", path)
+                    conn.putheader("User-Agent", DEFAULT_USER_AGENT)
+                    conn.endheaders()
+                else:
+                    conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                if discard_body:
+                    # Drain so the connection can be reused, keeping only a count
+                    body = b""
+                    content_length = 0
+                    while chunk := response.read(READ_CHUNK_SIZE):
+                        content_length += len(chunk)
+                else:
+                    body = response.read()
+                    content_length = len(body)
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            self._remember_tls_session(key, conn)
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(key, conn)
+
+            return (
+                response.status,
+                response.reason,
+                response.headers,
+                body,
+                content_length,
+            )
+
+    def _make_request_internal(
+        self, request: APIRequest, discard_body: bool = False
+    ) -> APIResponse:
         """
         Internal method to make HTTP request.
 
         Args:
             request: API request configuration
+            discard_body: Read the response body without decoding or storing it
 
         Returns:
             APIResponse with results
@@ -44,49 +252,62 @@ class APIClient:
         error_msg = None
 
         try:
-            # Prepare request
-            data = None
-            if request.body:
-                data = json.dumps(request.body).encode("utf-8")
-                request.headers.setdefault("Content-Type", "application/json")
-
-            # Build URL with query parameters
-            url = request.url
-            if request.params:
-                params = urllib.parse.urlencode(request.params)
-                url = f"{url}?{params}"
-
-            # Create request object
-            req = urllib.request.Request(
-                url, data=data, headers=request.headers, method=request.method
-            )
-
-            # Make request
-            with urllib.request.urlopen(
-                req,
-                timeout=request.timeout,
-                context=(
-                    None if self.config.verify_ssl else self._get_unverified_context()
-                ),
-            ) as response:
-                body = response.read().decode("utf-8")
-                status_code = response.status
-                headers = dict(response.headers)
-
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8") if e.fp else ""
-            status_code = e.code
-            headers = dict(e.headers) if e.headers else {}
-            error_msg = f"HTTP {e.code}: {e.reason}"
-
-        except urllib.error.URLError as e:
+            # Body, headers and target are pre-serialized on the request
+            data = request._encoded_body
+            headers = request._final_headers
+            origin, path = request._origin, request._path_qs
+
+            # Make request, following redirects the way urllib does
+            method = request.method
+            url = request._full_url
+            simple_get = request._is_simple_get
+            for _ in range(MAX_REDIRECTS + 1):
+                status_code, reason, resp_headers, raw_body, content_length = (
+                    self._send(
+                        method,
+                        origin,
+                        path,
+                        data,
+                        headers,
+                        request.timeout,
+                        discard_body,
+                        simple_get,
+                    )
+                )
+                location = resp_headers.get("Location")
+                if not (
+                    self.config.follow_redirects
+                    and status_code in REDIRECT_CODES
+                    and location
+                ):
+                    break
+                if method not in ("GET", "HEAD"):
+                    if status_code not in (301, 302, 303) or method != "POST":
+                        break
+                    method, data = "GET", None
+                    headers = {
+                        k: v
+                        for k, v in headers.items()
+                        if k.lower() not in ("content-type", "content-length")
+                    }
+                url = urllib.parse.urljoin(url, location)
+                origin, path = split_url(urllib.parse.urlsplit(url))
+
+            body = raw_body.decode("utf-8")
+            headers = dict(resp_headers)
+            if status_code >= 300:
+                error_msg = f"HTTP {status_code}: {reason}"
+
+        except OSError as e:
             body = ""
+            content_length = 0
             status_code = 0
             headers = {}
-            error_msg = f"URL Error: {e.reason}"
+            error_msg = f"URL Error: {e}"
 
         except Exception as e:
             body = ""
+            content_length = 0
             status_code = 0
             headers = {}
             error_msg = f"{type(e).__name__}: {str(e)}"
@@ -98,84 +319,86 @@ class APIClient:
             headers=headers,
             body=body,
             elapsed_time=elapsed_time,
-            timestamp=datetime.now(),
             error=error_msg,
+            content_length=content_length,
         )
 
-    @staticmethod
-    def _get_unverified_context():
-        """Create SSL context that doesn't verify certificates."""
-        import ssl
-
-        return ssl._create_unverified_context()
-
-    def make_request(self, request: APIRequest) -> APIResponse:
+    def close(self):
+        """Close all pooled keep-alive connections."""
+        with self._pool_lock:
+            pools, self._pools = self._pools, {}
+            self._tls_sessions.clear()
+        for conns in pools.values():
+            for conn in conns:
+                conn.close()
+
+    def make_request(
+        self, request: APIRequest, discard_body: bool = False
+    ) -> APIResponse:
         """
         Make a single API request with configured retry and rate limiting.
 
         Args:
             request: API request configuration
+            discard_body: Read the response body without decoding or storing it
+                (only content_length is kept)
 
         Returns:
             APIResponse with results
         """
-        # Build decorated function based on config
-        fn = self._call_counter
+        return self._dispatch(request, discard_body=discard_body)
 
-        # Apply retry decorator if configured
-        if self.config.retry_attempts > 1:
-            fn = retry(
-                attempts=self.config.retry_attempts, delay=self.config.retry_delay
-            )(fn)
-
-        # Apply rate limiting if configured
-        if self.config.rate_limit:
-            fn = rate_limit(self.config.rate_limit)(fn)
-
-        return fn(request)
-
-    def benchmark(self, request: APIRequest, num_requests: int = 10) -> BenchmarkResult:
+    def benchmark(
+        self, request: APIRequest, num_requests: int = 10, threads: int = 1
+    ) -> BenchmarkResult:
         """
         Benchmark an endpoint by making multiple requests.
 
+        Only timings, status codes and errors are kept unless
+        config.store_responses is set; bodies are drained and dropped unless
+        config.store_bodies is set as well. With config.streaming_stats only
+        running aggregates are kept, so memory stays constant in N.
+
         Args:
             request: API request configuration
             num_requests: Number of requests to make
+            threads: Worker threads sending requests in parallel (capped at 32);
+                each holds its own pooled connection while a request is in flight
 
         Returns:
             BenchmarkResult with aggregated statistics
         """
-        responses: List[APIResponse] = []
+        if num_requests < 0:
+            raise ValueError("num_requests must be non-negative")
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+
+        samples = benchmark_collector(num_requests, self.config)
+        discard_body = not (self.config.store_responses and self.config.store_bodies)
+        # Workers pull indices from one shared iterator (next() on a range
+        # iterator is atomic), so no per-request futures are queued up front
+        indices = iter(range(num_requests))
+
+        def worker():
+            for index in indices:
+                samples.record(
+                    index, self.make_request(request, discard_body=discard_body)
+                )
+
         start_time = time.perf_counter()
 
-        for _ in range(num_requests):
-            response = self.make_request(request)
-            responses.append(response)
+        if threads > 1 and num_requests >= MIN_THREADED_REQUESTS:
+            workers = min(threads, num_requests, MAX_BENCHMARK_THREADS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(worker) for _ in range(workers)]
+                for future in futures:
+                    future.result()
+        else:
+            worker()
 
         total_duration = time.perf_counter() - start_time
 
-        # Calculate statistics
-        successful = [r for r in responses if r.success]
-        failed = [r for r in responses if not r.success]
-
-        times = [r.elapsed_time for r in responses]
-        avg_time = statistics.mean(times) if times else 0.0
-        min_time = min(times) if times else 0.0
-        max_time = max(times) if times else 0.0
-        median_time = statistics.median(times) if times else 0.0
-
-        return BenchmarkResult(
-            url=request.url,
-            total_requests=num_requests,
-            successful_requests=len(successful),
-            failed_requests=len(failed),
-            avg_time=avg_time,
-            min_time=min_time,
-            max_time=max_time,
-            median_time=median_time,
-            total_duration=total_duration,
-            responses=responses,
-        )
+        return samples.to_result(request.url, total_duration)
 
     @property
     def call_count(self) -> int:
@@ -185,3 +408,8 @@ class APIClient:
     def reset_counter(self):
         """Reset the request counter."""
         self._call_counter.reset()
+
+    def cache_clear(self):
+        """Drop all cached responses (no-op when caching is disabled)."""
+        if self.config.cache_responses:
+            self._dispatch.cache_clear()
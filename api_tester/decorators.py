@@ -4,10 +4,17 @@ Decorators for API testing.
 Reuses patterns from the decorator examples: retry, rate limiting, timing, logging.
 """
 
+import dataclasses
+import threading
 import time
 from functools import wraps
 from typing import Any, Callable
 
+from cachetools import TTLCache
+
+# Methods whose responses may be served from cache
+CACHEABLE_METHODS = ("GET", "HEAD", "OPTIONS")
+
 
 def retry(attempts: int = 3, delay: float = 0.5, backoff: float = 2.0):
     """
@@ -45,20 +52,26 @@ def rate_limit(requests_per_second: float):
     """
     Rate limiting decorator to control request frequency.
 
+    Uses the monotonic clock so wall-clock adjustments can't skew spacing, and
+    a lock so concurrent callers are spaced out rather than racing.
+
     Args:
         requests_per_second: Maximum requests allowed per second
     """
     min_interval = 1.0 / requests_per_second
-    last_called = [0.0]
+    lock = threading.Lock()
+    last_called = float("-inf")
 
     def decorator(fn: Callable) -> Callable:
         @wraps(fn)
         def wrapper(*args, **kwargs) -> Any:
-            elapsed = time.time() - last_called[0]
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
+            nonlocal last_called
+            with lock:
+                elapsed = time.monotonic() - last_called
+                if elapsed < min_interval:
+                    time.sleep(min_interval - elapsed)
 
-            last_called[0] = time.time()
+                last_called = time.monotonic()
             return fn(*args, **kwargs)
 
         return wrapper
@@ -66,6 +79,63 @@ def rate_limit(requests_per_second: float):
     return decorator
 
 
+def cache_response(maxsize: int = 1024, ttl: float = 60.0):
+    """
+    TTL cache decorator for functions taking an APIRequest and returning an
+    APIResponse.
+
+    Only idempotent methods are cached and responses carrying an error are
+    never stored. A cache hit returns a copy of the stored response with
+    ``elapsed_time`` set to the lookup time and a fresh ``timestamp_ns``, so
+    timings and timestamps reflect the call that was actually served. The
+    wrapper exposes ``cache_clear()`` like functools caches.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a cached response stays valid
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(request, **kwargs) -> Any:
+            if request.method not in CACHEABLE_METHODS:
+                return fn(request, **kwargs)
+
+            key = (
+                request.method,
+                request._full_url,
+                frozenset(request.headers.items()),
+                frozenset(kwargs.items()),
+            )
+            start = time.perf_counter()
+            with lock:
+                cached = cache.get(key)
+            if cached is not None:
+                return dataclasses.replace(
+                    cached,
+                    elapsed_time=time.perf_counter() - start,
+                    timestamp_ns=time.time_ns(),
+                )
+
+            response = fn(request, **kwargs)
+            if response.error is None:
+                with lock:
+                    cache[key] = response
+            return response
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
 def timeit(fn: Callable) -> Callable:
     """
     Timing decorator that measures function execution time.
@@ -117,17 +187,28 @@ class CallCounter:
     """
     Class-based decorator to count function calls.
     Demonstrates class-based decorator pattern.
+
+    The count is updated under a lock so it stays exact when the wrapped
+    function is called from several threads.
     """
 
     def __init__(self, fn: Callable):
         self.fn = fn
-        self.count = 0
+        self._lock = threading.Lock()
+        self._count = 0
         wraps(fn)(self)
 
     def __call__(self, *args, **kwargs) -> Any:
-        self.count += 1
+        with self._lock:
+            self._count += 1
         return self.fn(*args, **kwargs)
 
+    @property
+    def count(self) -> int:
+        """Number of calls since creation or the last reset."""
+        return self._count
+
     def reset(self):
         """Reset the counter."""
-        self.count = 0
+        with self._lock:
+            self._count = 0
@@ -1,12 +1,47 @@
 """
 Data models for API testing using dataclasses.
 
-Demonstrates: frozen dataclasses, post_init validation, default_factory, field customization.
+Demonstrates: frozen and slotted dataclasses, post_init validation, default_factory, field customization.
 """
 
+import math
+import random
+import threading
+import time
+import urllib.parse
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import __version__
+from .serialization import dumps
+
+DEFAULT_USER_AGENT = f"api_tester/{__version__}"
+
+# (scheme, host, port) identifying the server a request is sent to
+Origin = Tuple[str, str, int]
+
+
+def split_url(
+    parts: urllib.parse.SplitResult, query: str = ""
+) -> Tuple[Origin, str]:
+    """
+    Split a parsed URL into its origin and the path (plus query) sent on the wire.
+
+    Args:
+        parts: Absolute http(s) URL as returned by urllib.parse.urlsplit
+        query: Extra encoded query string appended to any query in the URL
+    """
+    scheme = parts.scheme.lower()
+    default_port = 443 if scheme == "https" else 80
+    origin = (scheme, parts.hostname or "", parts.port or default_port)
+    path = parts.path or "/"
+    query = "&".join(q for q in (parts.query, query) if q)
+    if query:
+        path = f"{path}?{query}"
+    return origin, path
 
 
 @dataclass
@@ -20,8 +55,21 @@ class APIRequest:
     body: Optional[Dict[str, Any]] = None
     timeout: float = 30.0
 
+    # Wire-ready values computed once so repeated sends skip re-encoding.
+    # Fields are read at construction; build a new request to change them.
+    _encoded_body: Optional[bytes] = field(init=False, repr=False, compare=False)
+    _final_headers: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _parsed_url: urllib.parse.SplitResult = field(
+        init=False, repr=False, compare=False
+    )
+    _full_url: str = field(init=False, repr=False, compare=False)
+    _origin: Origin = field(init=False, repr=False, compare=False)
+    _path_qs: str = field(init=False, repr=False, compare=False)
+    # GET with no body or caller headers: only the default User-Agent is sent
+    _is_simple_get: bool = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Validate request configuration."""
+        """Validate request configuration and pre-serialize it for sending."""
         self.method = self.method.upper()
         if self.method not in [
             "GET",
@@ -38,8 +86,27 @@ class APIRequest:
         if not self.url.startswith(("http://", "https://")):
             raise ValueError("URL must start with http:// or https://")
 
+        self._encoded_body = dumps(self.body) if self.body else None
+        header_names = {key.lower() for key in self.headers}
+        self._final_headers = dict(self.headers)
+        if "user-agent" not in header_names:
+            self._final_headers["User-Agent"] = DEFAULT_USER_AGENT
+        if self._encoded_body is not None and "content-type" not in header_names:
+            self._final_headers["Content-Type"] = "application/json"
+
+        self._parsed_url = urllib.parse.urlsplit(self.url)
+        query = urllib.parse.urlencode(self.params) if self.params else ""
+        self._full_url = self.url
+        if query:
+            separator = "&" if self._parsed_url.query else "?"
+            self._full_url = f"{self.url}{separator}{query}"
+        self._origin, self._path_qs = split_url(self._parsed_url, query)
+        self._is_simple_get = (
+            self.method == "GET" and not self.body and not self.headers
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class APIResponse:
     """Immutable response from an API request."""
 
@@ -47,8 +114,9 @@ class APIResponse:
     headers: Dict[str, str]
     body: str
     elapsed_time: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # ns since the epoch
     error: Optional[str] = None
+    content_length: int = 0  # bytes received, also counted when body is discarded
 
     @property
     def success(self) -> bool:
@@ -60,6 +128,11 @@ class APIResponse:
         """Return elapsed time in milliseconds."""
         return self.elapsed_time * 1000
 
+    @property
+    def timestamp(self) -> datetime:
+        """Return the response time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
 
 @dataclass
 class TestConfig:
@@ -68,9 +141,15 @@ class TestConfig:
     retry_attempts: int = 3
     retry_delay: float = 0.5
     rate_limit: Optional[float] = None  # requests per second
-    cache_responses: bool = False
+    rate_limit_burst: int = 1  # requests allowed back-to-back before throttling
+    cache_responses: bool = False  # cache GET/HEAD/OPTIONS responses
+    cache_ttl: float = 60.0  # seconds a cached response stays valid
+    cache_maxsize: int = 1024
     verify_ssl: bool = True
     follow_redirects: bool = True
+    store_responses: bool = False  # keep every APIResponse from benchmark runs
+    store_bodies: bool = True  # keep bodies on those stored responses
+    streaming_stats: bool = False  # constant-memory benchmark statistics
 
     def __post_init__(self):
         """Validate test configuration."""
@@ -80,11 +159,60 @@ class TestConfig:
             raise ValueError("retry_delay must be non-negative")
         if self.rate_limit is not None and self.rate_limit <= 0:
             raise ValueError("rate_limit must be positive")
+        if self.rate_limit_burst < 1:
+            raise ValueError("rate_limit_burst must be at least 1")
+        if self.cache_ttl <= 0:
+            raise ValueError("cache_ttl must be positive")
+        if self.cache_maxsize < 1:
+            raise ValueError("cache_maxsize must be at least 1")
+        if self.streaming_stats and self.store_responses:
+            raise ValueError("streaming_stats cannot be combined with store_responses")
+
+
+# Requests sampled for percentiles when benchmark stats are streamed
+RESERVOIR_SIZE = 10_000
+
+
+def _order_statistics(times: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """Return (min, max, median, p95, p99) of a non-empty timing array."""
+    # One partial sort places min, max, both middle elements and the
+    # nearest-rank p95/p99 at their sorted positions
+    n = times.size
+    mid = n // 2
+    p95_rank = max(0, math.ceil(0.95 * n) - 1)
+    p99_rank = max(0, math.ceil(0.99 * n) - 1)
+    ranked = np.partition(
+        times, sorted({0, n - 1, (n - 1) // 2, mid, p95_rank, p99_rank})
+    )
+    return (
+        float(ranked[0]),
+        float(ranked[n - 1]),
+        float((ranked[(n - 1) // 2] + ranked[mid]) / 2),
+        float(ranked[p95_rank]),
+        float(ranked[p99_rank]),
+    )
+
 
+def _status_classes(counts: Sequence[int]) -> Dict[str, int]:
+    """
+    Name per-class counts indexed by status // 100 ("2xx", "5xx", ...), with
+    index 0 (no response received) reported as "error".
+    """
+    classes = {f"{cls}xx": int(counts[cls]) for cls in range(1, 10) if counts[cls]}
+    if counts[0]:
+        classes["error"] = int(counts[0])
+    return classes
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BenchmarkResult:
-    """Immutable results from benchmarking an endpoint."""
+    """
+    Immutable results from benchmarking an endpoint.
+
+    Per-request data is kept column-wise (times, status_codes, errors);
+    the full APIResponse objects are only kept when requested. Results
+    built from streamed statistics carry no per-request columns.
+    """
 
     url: str
     total_requests: int
@@ -95,7 +223,90 @@ class BenchmarkResult:
     max_time: float
     median_time: float
     total_duration: float
-    responses: List[APIResponse] = field(default_factory=list)
+    p95_time: float = 0.0
+    p99_time: float = 0.0
+    std_time: float = 0.0
+    status_class_counts: Dict[str, int] = field(default_factory=dict)
+    responses: Optional[List[APIResponse]] = None
+    times: np.ndarray = field(
+        default_factory=lambda: np.empty(0), repr=False, compare=False
+    )
+    status_codes: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int16), repr=False, compare=False
+    )
+    errors: List[Optional[str]] = field(default_factory=list, repr=False)
+    ok_mask: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=bool), repr=False, compare=False
+    )
+
+    @classmethod
+    def from_columns(
+        cls,
+        url: str,
+        times: np.ndarray,
+        status_codes: np.ndarray,
+        errors: List[Optional[str]],
+        total_duration: float,
+        responses: Optional[List[APIResponse]] = None,
+    ) -> "BenchmarkResult":
+        """Aggregate per-request columns into benchmark statistics."""
+        n = times.size
+        # Same rule as APIResponse.success, evaluated once over the whole batch
+        ok = (
+            (status_codes >= 200)
+            & (status_codes < 300)
+            & np.fromiter((e is None for e in errors), dtype=bool, count=n)
+        )
+        successful = int(np.count_nonzero(ok))
+        class_counts = np.bincount(
+            np.minimum(status_codes.astype(np.intp) // 100, 9), minlength=10
+        )
+
+        if n:
+            avg_time = float(times.mean())
+            std_time = float(times.std(ddof=1)) if n > 1 else 0.0
+            min_time, max_time, median_time, p95_time, p99_time = (
+                _order_statistics(times)
+            )
+        else:
+            avg_time = std_time = min_time = max_time = 0.0
+            median_time = p95_time = p99_time = 0.0
+
+        return cls(
+            url=url,
+            total_requests=n,
+            successful_requests=successful,
+            failed_requests=n - successful,
+            avg_time=avg_time,
+            min_time=min_time,
+            max_time=max_time,
+            median_time=median_time,
+            total_duration=total_duration,
+            p95_time=p95_time,
+            p99_time=p99_time,
+            std_time=std_time,
+            status_class_counts=_status_classes(class_counts),
+            responses=responses,
+            times=times,
+            status_codes=status_codes,
+            errors=errors,
+            ok_mask=ok,
+        )
+
+    @classmethod
+    def from_responses(
+        cls, url: str, responses: Sequence[APIResponse], total_duration: float
+    ) -> "BenchmarkResult":
+        """
+        Aggregate individual responses into benchmark statistics.
+
+        The clients record straight into columns; this is kept as public API
+        for library callers that already hold a list of APIResponse objects.
+        """
+        samples = BenchmarkSamples(len(responses), keep_responses=True)
+        for index, response in enumerate(responses):
+            samples.record(index, response)
+        return samples.to_result(url, total_duration)
 
     @property
     def success_rate(self) -> float:
@@ -110,3 +321,140 @@ class BenchmarkResult:
         if self.total_duration == 0:
             return 0.0
         return self.total_requests / self.total_duration
+
+
+class BenchmarkSamples:
+    """
+    Preallocated per-request columns filled in while a benchmark runs.
+
+    Each request writes only its own index, so threads and tasks can record
+    concurrently without a lock.
+    """
+
+    __slots__ = ("times", "status_codes", "errors", "responses")
+
+    def __init__(self, num_requests: int, keep_responses: bool = False):
+        self.times = np.empty(num_requests, dtype=np.float64)
+        self.status_codes = np.empty(num_requests, dtype=np.int16)
+        self.errors: List[Optional[str]] = [None] * num_requests
+        self.responses: Optional[List[Optional[APIResponse]]] = (
+            [None] * num_requests if keep_responses else None
+        )
+
+    def record(self, index: int, response: APIResponse):
+        """Store the measurements of one response at the given position."""
+        self.times[index] = response.elapsed_time
+        self.status_codes[index] = response.status_code
+        self.errors[index] = response.error
+        if self.responses is not None:
+            self.responses[index] = response
+
+    def to_result(self, url: str, total_duration: float) -> BenchmarkResult:
+        """Reduce the collected columns into a BenchmarkResult."""
+        return BenchmarkResult.from_columns(
+            url,
+            self.times,
+            self.status_codes,
+            self.errors,
+            total_duration,
+            responses=self.responses,
+        )
+
+
+class StreamingStats:
+    """
+    Constant-memory benchmark statistics updated as each response arrives.
+
+    Mean and variance use Welford's online algorithm, min/max and status
+    counts are exact, and median/p95/p99 come from a uniform reservoir
+    sample of RESERVOIR_SIZE timings (exact while fewer requests were
+    made). Updates take a lock so threads can share one instance.
+    """
+
+    __slots__ = (
+        "count",
+        "successful",
+        "mean",
+        "m2",
+        "min_time",
+        "max_time",
+        "class_counts",
+        "_reservoir",
+        "_rng",
+        "_lock",
+    )
+
+    def __init__(self, reservoir_size: int = RESERVOIR_SIZE):
+        self.count = 0
+        self.successful = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_time = math.inf
+        self.max_time = -math.inf
+        self.class_counts = [0] * 10
+        self._reservoir = np.empty(reservoir_size, dtype=np.float64)
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+
+    def update(self, elapsed: float, status_code: int, success: bool):
+        """Fold one request's measurements into the running statistics."""
+        with self._lock:
+            self.count += 1
+            delta = elapsed - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (elapsed - self.mean)
+            self.min_time = min(self.min_time, elapsed)
+            self.max_time = max(self.max_time, elapsed)
+            self.class_counts[min(status_code // 100, 9)] += 1
+            if success:
+                self.successful += 1
+
+            # Reservoir sampling (Algorithm R): every request is kept with
+            # equal probability reservoir_size / count
+            size = self._reservoir.size
+            if self.count <= size:
+                self._reservoir[self.count - 1] = elapsed
+            else:
+                slot = self._rng.randrange(self.count)
+                if slot < size:
+                    self._reservoir[slot] = elapsed
+
+    def record(self, index: int, response: APIResponse):
+        """Fold one response into the statistics (index is unused)."""
+        self.update(response.elapsed_time, response.status_code, response.success)
+
+    def to_result(self, url: str, total_duration: float) -> BenchmarkResult:
+        """Build a BenchmarkResult from the aggregated statistics."""
+        n = self.count
+        if n:
+            sample = self._reservoir[: min(n, self._reservoir.size)]
+            _, _, median_time, p95_time, p99_time = _order_statistics(sample)
+            avg_time = self.mean
+            std_time = math.sqrt(self.m2 / (n - 1)) if n > 1 else 0.0
+            min_time, max_time = self.min_time, self.max_time
+        else:
+            avg_time = std_time = min_time = max_time = 0.0
+            median_time = p95_time = p99_time = 0.0
+
+        return BenchmarkResult(
+            url=url,
+            total_requests=n,
+            successful_requests=self.successful,
+            failed_requests=n - self.successful,
+            avg_time=avg_time,
+            min_time=min_time,
+            max_time=max_time,
+            median_time=median_time,
+            total_duration=total_duration,
+            p95_time=p95_time,
+            p99_time=p99_time,
+            std_time=std_time,
+            status_class_counts=_status_classes(self.class_counts),
+        )
+
+
+def benchmark_collector(num_requests: int, config: TestConfig):
+    """Return the per-request collector a benchmark run should record into."""
+    if config.streaming_stats:
+        return StreamingStats()
+    return BenchmarkSamples(num_requests, config.store_responses)
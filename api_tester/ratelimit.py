@@ -0,0 +1,71 @@
+"""
+Token-bucket rate limiting shared by the sync and async clients.
+
+Unlike the ``rate_limit`` decorator, a bucket allows bursts of up to
+``capacity`` requests and stays correct when several threads or tasks draw
+from it at once.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import ContextDecorator
+
+
+class TokenBucket(ContextDecorator):
+    """
+    Token bucket refilled at ``rate`` tokens per second, holding at most
+    ``capacity`` tokens.
+
+    Use ``with bucket:`` (or ``@bucket`` as a decorator) from threads, or
+    ``async with bucket:`` from coroutines; all block until a token is
+    available.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token and return how long the caller must sleep before using it.
+
+        The token is reserved immediately (the balance may go negative), so
+        concurrent callers queue up behind each other instead of all waking
+        at once and racing for the same refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def __enter__(self):
+        delay = self.acquire()
+        if delay > 0:
+            time.sleep(delay)
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    async def __aenter__(self):
+        delay = self.acquire()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
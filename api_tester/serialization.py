@@ -0,0 +1,46 @@
+"""
+JSON encoding helpers.
+
+Uses orjson when it is installed (``pip install api_tester[fast]``) and falls
+back to the standard library json module otherwise.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    import json
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps_pretty(obj: Any) -> str:
+        """Encode obj as JSON text indented by two spaces."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def dumps_pretty(obj: Any) -> str:
+        """Encode obj as JSON text indented by two spaces."""
+        return json.dumps(obj, indent=2)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return json.loads(data)